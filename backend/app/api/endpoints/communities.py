@@ -7,6 +7,7 @@ from typing import Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
 
+from app.services.cache_service import cache_service
 from app.services.community_detection import community_detection_service
 from app.services.community_summarization import community_summarization_service
 
@@ -28,6 +29,7 @@ async def detect_communities() -> Dict:
     """
     try:
         result = community_detection_service.detect_communities()
+        cache_service.bump_graph_version()
         return result
     except Exception as e:
         logger.error(f"Community detection error: {str(e)}")
@@ -108,6 +110,7 @@ async def summarize_community(community_id: int) -> Dict:
     """
     try:
         result = community_summarization_service.summarize_community(community_id)
+        cache_service.bump_graph_version()
         return result
     except Exception as e:
         logger.error(f"Community summarization error: {str(e)}")
@@ -124,6 +127,7 @@ async def summarize_all_communities() -> Dict:
     """
     try:
         result = community_summarization_service.summarize_all_communities()
+        cache_service.bump_graph_version()
         return result
     except Exception as e:
         logger.error(f"Summarize all communities error: {str(e)}")
@@ -6,7 +6,9 @@ import time
 import logging
 from typing import Dict, Optional, Any, Union
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.db.postgres import get_db
@@ -36,6 +38,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/tog", tags=["tog"])
 
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson (fastapi.responses.ORJSONResponse is deprecated)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 # Initialize ToG services
 tog_service = ToGService(graph_service, llm_service)
 tog_visualization = ToGVisualizationService()
@@ -321,12 +331,12 @@ async def tog_config(
         )
 
 
-@router.get("/visualize/{query_id}")
+@router.get("/visualize/{query_id}", response_class=OrjsonResponse)
 async def get_reasoning_visualization(
     query_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> Dict[str, Any]:
+) -> OrjsonResponse:
     """
     Get visualization data for a ToG reasoning path.
 
@@ -362,7 +372,8 @@ async def get_reasoning_visualization(
             reasoning_path, db_query.question
         )
 
-        return visualization_data
+        # Serialize with orjson directly, skipping FastAPI's jsonable_encoder pass
+        return OrjsonResponse(content=visualization_data)
 
     except Exception as e:
         logger.error(f"Failed to generate visualization for query {query_id}: {e}")
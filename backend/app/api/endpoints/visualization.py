@@ -15,19 +15,24 @@ router = APIRouter(tags=["visualization"])
 
 
 @router.get("/entity-graph")
-async def get_entity_graph(limit: int = 100, include_communities: bool = True) -> Dict:
+async def get_entity_graph(
+    limit: int = 100, include_communities: bool = True, include_inline_style: bool = False
+) -> Dict:
     """
     Get entity graph for visualization
 
     Args:
         limit: Maximum number of entities
         include_communities: Whether to include community nodes
+        include_inline_style: Whether to attach a per-node style dict
 
     Returns:
         Dictionary with nodes and edges for Cytoscape.js
     """
     try:
-        result = visualization_service.get_entity_graph(limit, include_communities)
+        result = await visualization_service.get_entity_graph(
+            limit, include_communities, include_inline_style
+        )
         return result
     except Exception as e:
         logger.error(f"Entity graph visualization error: {str(e)}")
@@ -35,19 +40,24 @@ async def get_entity_graph(limit: int = 100, include_communities: bool = True) -
 
 
 @router.get("/community-graph")
-async def get_community_graph(include_members: bool = True, max_members: int = 10) -> Dict:
+async def get_community_graph(
+    include_members: bool = True, max_members: int = 10, include_inline_style: bool = False
+) -> Dict:
     """
     Get community graph for visualization
 
     Args:
         include_members: Whether to include entity members
         max_members: Maximum members per community
+        include_inline_style: Whether to attach a per-node style dict
 
     Returns:
         Dictionary with community graph data
     """
     try:
-        result = visualization_service.get_community_graph(include_members, max_members)
+        result = await visualization_service.get_community_graph(
+            include_members, max_members, include_inline_style
+        )
         return result
     except Exception as e:
         logger.error(f"Community graph visualization error: {str(e)}")
@@ -55,15 +65,18 @@ async def get_community_graph(include_members: bool = True, max_members: int = 1
 
 
 @router.get("/hierarchical-graph")
-async def get_hierarchical_graph() -> Dict:
+async def get_hierarchical_graph(limit: int = 500) -> Dict:
     """
     Get hierarchical graph (documents -> entities -> communities)
 
+    Args:
+        limit: Maximum number of document/text unit/entity/community paths
+
     Returns:
         Dictionary with hierarchical graph data
     """
     try:
-        result = visualization_service.get_hierarchical_graph()
+        result = await visualization_service.get_hierarchical_graph(limit)
         return result
     except Exception as e:
         logger.error(f"Hierarchical graph visualization error: {str(e)}")
@@ -83,7 +96,7 @@ async def get_ego_graph(entity_id: str, hop_limit: int = 2) -> Dict:
         Dictionary with ego graph data
     """
     try:
-        result = visualization_service.get_ego_graph(entity_id, hop_limit)
+        result = await visualization_service.get_ego_graph(entity_id, hop_limit)
         return result
     except Exception as e:
         logger.error(f"Ego graph visualization error: {str(e)}")
@@ -33,6 +33,11 @@ class Settings:
     NEO4J_URI: str = os.getenv("NEO4J_URI", "bolt://neo4j:7687")
     NEO4J_USERNAME: str = os.getenv("NEO4J_USERNAME", "neo4j")
     NEO4J_PASSWORD: str = os.getenv("NEO4J_PASSWORD", "graphtog_password")
+    # Naming the database explicitly avoids a home-database lookup per session
+    NEO4J_DATABASE: str = os.getenv("NEO4J_DATABASE", "neo4j")
+    # Per-driver pool; size it to workers x expected concurrent graph requests
+    NEO4J_POOL_SIZE: int = int(os.getenv("NEO4J_POOL_SIZE", "100"))
+    NEO4J_ACQUISITION_TIMEOUT: float = float(os.getenv("NEO4J_ACQUISITION_TIMEOUT", "120"))
 
     # ========== CACHE - Redis ==========
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://redis:6379/0")
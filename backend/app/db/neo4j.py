@@ -4,7 +4,8 @@ Neo4j graph database connection and schema management
 
 from typing import Optional
 
-from neo4j import GraphDatabase, Session as Neo4jSession
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession, GraphDatabase
+from neo4j import Session as Neo4jSession
 
 from app.config import get_settings
 
@@ -14,6 +15,8 @@ class Neo4jConnection:
 
     _instance: Optional["Neo4jConnection"] = None
     _driver = None
+    _async_driver: Optional[AsyncDriver] = None
+    _database: Optional[str] = None
 
     def __new__(cls):
         """Singleton pattern - ensure only one connection instance"""
@@ -28,19 +31,42 @@ class Neo4jConnection:
             self._driver = GraphDatabase.driver(
                 settings.NEO4J_URI,
                 auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
-                max_connection_pool_size=100,  # Increased from default 100 to handle concurrent requests
-                connection_acquisition_timeout=120.0,  # Increased from 60s to 120s
+                max_connection_pool_size=settings.NEO4J_POOL_SIZE,
+                connection_acquisition_timeout=settings.NEO4J_ACQUISITION_TIMEOUT,
             )
+            self._database = settings.NEO4J_DATABASE
 
     def get_session(self) -> Neo4jSession:
         """Get a Neo4j session"""
-        return self._driver.session()
+        return self._driver.session(database=self._database)
+
+    def get_async_driver(self) -> AsyncDriver:
+        """Get the async driver, creating it on first use"""
+        if self._async_driver is None:
+            settings = get_settings()
+            self._async_driver = AsyncGraphDatabase.driver(
+                settings.NEO4J_URI,
+                auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
+                max_connection_pool_size=settings.NEO4J_POOL_SIZE,
+                connection_acquisition_timeout=settings.NEO4J_ACQUISITION_TIMEOUT,
+            )
+        return self._async_driver
+
+    def get_async_session(self) -> AsyncSession:
+        """Get an async Neo4j session"""
+        return self.get_async_driver().session(database=self._database)
 
     def close(self):
         """Close Neo4j connection"""
         if self._driver is not None:
             self._driver.close()
 
+    async def close_async(self):
+        """Close the async driver if it was created"""
+        if self._async_driver is not None:
+            await self._async_driver.close()
+            self._async_driver = None
+
     def init_schema(self):
         """Initialize graph schema with constraints and indexes"""
         session = self.get_session()
@@ -85,12 +111,28 @@ def get_neo4j_session() -> Neo4jSession:
     return get_neo4j_connection().get_session()
 
 
+def get_neo4j_async_driver() -> AsyncDriver:
+    """Get the process-wide async Neo4j driver"""
+    return get_neo4j_connection().get_async_driver()
+
+
+def get_neo4j_async_session() -> AsyncSession:
+    """Get an async Neo4j session for queries"""
+    return get_neo4j_connection().get_async_session()
+
+
 def init_neo4j() -> None:
     """Initialize Neo4j connection and schema"""
     connection = get_neo4j_connection()
     connection.init_schema()
 
 
+async def close_neo4j_async() -> None:
+    """Close the async Neo4j driver"""
+    if _neo4j_connection is not None:
+        await _neo4j_connection.close_async()
+
+
 def close_neo4j() -> None:
     """Close Neo4j connection"""
     global _neo4j_connection
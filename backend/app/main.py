@@ -12,7 +12,7 @@ from fastapi.exceptions import HTTPException
 from fastapi.responses import JSONResponse
 
 from app.config import get_settings
-from app.db.neo4j import close_neo4j, init_neo4j
+from app.db.neo4j import close_neo4j, close_neo4j_async, get_neo4j_async_driver, init_neo4j
 from app.db.postgres import init_db
 
 # Setup logging
@@ -42,6 +42,9 @@ async def lifespan(app: FastAPI):
     # Initialize Neo4j
     try:
         init_neo4j()
+        # Create the shared async driver up front so its pool lives for the whole process;
+        # services reach it through get_neo4j_async_session()
+        get_neo4j_async_driver()
         logger.info("✅ Neo4j graph database initialized")
     except Exception as e:
         logger.error(f"❌ Neo4j initialization error: {str(e)}")
@@ -62,6 +65,7 @@ async def lifespan(app: FastAPI):
     # Shutdown event
     logger.info("🛑 Shutting down GraphToG application...")
     try:
+        await close_neo4j_async()
         close_neo4j()
         logger.info("✅ Neo4j connection closed")
     except Exception as e:
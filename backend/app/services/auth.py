@@ -6,6 +6,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 import logging
+from uuid import UUID
 
 from app.db.postgres import get_db
 from app.models.user import User
@@ -45,7 +46,16 @@ def get_current_user(
         )
 
     logger.info(f"✅ Token verified for user: {token_data.sub}")
-    user = db.query(User).filter(User.id == token_data.sub).first()
+    try:
+        # Compare as a UUID: the string form only matches through PostgreSQL's implicit cast
+        user_id = UUID(token_data.sub)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+        ) from None
+
+    user = db.query(User).filter(User.id == user_id).first()
     if not user:
         logger.error(f"❌ User not found for ID: {token_data.sub}")
         raise HTTPException(
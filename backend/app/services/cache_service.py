@@ -6,6 +6,7 @@ import json
 import logging
 from typing import Any, Dict, Optional
 
+import orjson
 import redis
 
 from app.config import get_settings
@@ -18,6 +19,8 @@ settings = get_settings()
 class CacheService:
     """Service for Redis-based caching"""
 
+    GRAPH_VERSION_KEY = "graph:version"
+
     def __init__(self):
         """Initialize cache service"""
         self.redis_client = None
@@ -178,6 +181,65 @@ class CacheService:
         """Get cached retrieval result"""
         return self.get_cache(f"retrieval:{retrieval_id}")
 
+    def cache_visualization(self, key: str, payload: Dict, ttl: int = 60) -> bool:
+        """Cache a visualization payload, serialized with orjson"""
+        try:
+            client = self.get_redis_client()
+            if not client:
+                return False
+
+            client.setex(f"viz:{key}", ttl, orjson.dumps(payload))
+            return True
+
+        except Exception as e:
+            logger.warning(f"Visualization cache set failed for {key}: {str(e)}")
+            return False
+
+    def get_cached_visualization(self, key: str) -> Optional[Dict]:
+        """Get cached visualization payload"""
+        try:
+            client = self.get_redis_client()
+            if not client:
+                return None
+
+            value = client.get(f"viz:{key}")
+            return orjson.loads(value) if value else None
+
+        except Exception as e:
+            logger.warning(f"Visualization cache get failed for {key}: {str(e)}")
+            return None
+
+    def get_graph_version(self) -> Optional[int]:
+        """
+        Get the knowledge graph version used to namespace derived caches
+
+        Returns:
+            Current version, or None if Redis is unavailable
+        """
+        try:
+            client = self.get_redis_client()
+            if not client:
+                return None
+
+            return int(client.get(self.GRAPH_VERSION_KEY) or 0)
+
+        except Exception as e:
+            logger.warning(f"Could not read graph version: {str(e)}")
+            return None
+
+    def bump_graph_version(self) -> Optional[int]:
+        """Bump the graph version after entities or communities are written"""
+        try:
+            client = self.get_redis_client()
+            if not client:
+                return None
+
+            return client.incr(self.GRAPH_VERSION_KEY)
+
+        except Exception as e:
+            logger.warning(f"Could not bump graph version: {str(e)}")
+            return None
+
     def invalidate_entity_cache(self, entity_id: str) -> bool:
         """Invalidate entity cache"""
         return self.delete_cache(f"entity:{entity_id}")
@@ -193,6 +255,7 @@ class CacheService:
         count += self.clear_cache_pattern("community:*")
         count += self.clear_cache_pattern("query:*")
         count += self.clear_cache_pattern("retrieval:*")
+        count += self.clear_cache_pattern("viz:*")
         logger.info(f"Invalidated {count} cache entries")
         return count
 
@@ -213,7 +276,7 @@ class CacheService:
             }
 
             # Count keys by pattern
-            for pattern in ["entity:*", "community:*", "query:*", "retrieval:*"]:
+            for pattern in ["entity:*", "community:*", "query:*", "retrieval:*", "viz:*"]:
                 count = len(client.keys(pattern))
                 stats["keyspace"][pattern] = count
 
@@ -285,17 +285,20 @@ class CommunityDetectionService:
         try:
             session = self.get_session()
 
+            # Group members per community server-side, then fold the per-community
+            # rows into totals; an aggregate can't be nested inside collect()
             query = """
             MATCH (c:Community)
-            WITH c
             OPTIONAL MATCH (e:Entity)-[r:IN_COMMUNITY]->(c)
-            RETURN
-                count(DISTINCT c) AS num_communities,
-                count(DISTINCT e) AS total_members,
-                collect({
-                    id: c.id,
-                    size: count(DISTINCT e)
-                }) AS community_sizes
+            WITH c, count(DISTINCT e) AS size
+            WITH
+                count(c) AS num_communities,
+                collect({id: c.id, size: size}) AS community_sizes
+            CALL {
+                MATCH (e:Entity)-[:IN_COMMUNITY]->(:Community)
+                RETURN count(DISTINCT e) AS total_members
+            }
+            RETURN num_communities, total_members, community_sizes
             """
 
             result = session.run(query).single()
@@ -494,14 +497,15 @@ class CommunityDetectionService:
 
             # Drop existing subgraph if exists
             try:
-                session.run(f"CALL gds.graph.drop('{subgraph_name}')")
+                session.run("CALL gds.graph.drop($graph_name)", graph_name=subgraph_name)
             except:
                 pass
 
-            # Create subgraph projection
-            subgraph_query = f"""
+            # Create subgraph projection; the seeded graph name is passed as a
+            # parameter so the query text, and its cached plan, stay the same
+            subgraph_query = """
             CALL gds.graph.project.cypher(
-                '{subgraph_name}',
+                $graph_name,
                 'MATCH (e:Entity) WHERE e.id IN $entity_ids RETURN id(e) AS id',
                 'MATCH (e1:Entity)-[r:RELATED_TO]-(e2:Entity)
                  WHERE e1.id IN $entity_ids AND e2.id IN $entity_ids
@@ -513,6 +517,7 @@ class CommunityDetectionService:
 
             subgraph_result = session.run(
                 subgraph_query,
+                graph_name=subgraph_name,
                 entity_ids=expanded_entity_ids
             ).single()
 
@@ -530,23 +535,25 @@ class CommunityDetectionService:
             )
 
             # Step 5: Run Leiden on subgraph
-            leiden_query = f"""
+            leiden_query = """
             CALL gds.leiden.stream(
-                '{subgraph_name}',
-                {{
+                $graph_name,
+                {
                     randomSeed: $seed,
                     includeIntermediateCommunities: false,
                     tolerance: 0.0001,
                     maxLevels: 10,
                     concurrency: 4
-                }}
+                }
             )
             YIELD nodeId, communityId
             WITH gds.util.asNode(nodeId) AS node, communityId
             RETURN node.id AS entity_id, communityId
             """
 
-            leiden_results = session.run(leiden_query, seed=seed).data()
+            leiden_results = session.run(
+                leiden_query, graph_name=subgraph_name, seed=seed
+            ).data()
 
             # Step 6: Store new community assignments
             communities_created = set()
@@ -577,7 +584,7 @@ class CommunityDetectionService:
 
             # Step 7: Clean up subgraph
             try:
-                session.run(f"CALL gds.graph.drop('{subgraph_name}')")
+                session.run("CALL gds.graph.drop($graph_name)", graph_name=subgraph_name)
             except:
                 pass
 
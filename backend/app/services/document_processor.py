@@ -8,12 +8,13 @@ import hashlib
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models.document import Document
+from app.services.cache_service import cache_service
 from app.services.chunking import chunking_service
 from app.services.community_detection import community_detection_service
 from app.services.community_summarization import community_summarization_service
@@ -99,17 +100,19 @@ class DocumentProcessor:
             raise DocumentProcessingError(f"Unsupported file format: {file_ext}")
 
 
-def compute_content_hash(content: str) -> str:
+def compute_content_hash(content: Union[str, bytes]) -> str:
     """
     Compute SHA256 hash of document content
 
     Args:
-        content: Document text content
+        content: Document text content, or its UTF-8 bytes (hashed without re-encoding)
 
     Returns:
         SHA256 hash as hexadecimal string
     """
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
 
 
 def detect_document_changes(
@@ -144,6 +147,27 @@ def detect_document_changes(
     }
 
 
+def _entity_rows(entities: List[Dict]) -> List[Dict]:
+    """
+    Normalize extracted entities into rows for graph_service.bulk_create_entities
+
+    Args:
+        entities: Entity dicts as returned by the LLM extraction
+
+    Returns:
+        Rows with name, type, description and confidence filled in
+    """
+    return [
+        {
+            "name": entity.get("name", ""),
+            "type": entity.get("type", "OTHER"),
+            "description": entity.get("description", ""),
+            "confidence": entity.get("confidence", 0.8),
+        }
+        for entity in entities
+    ]
+
+
 async def process_document_with_graph(
     document_id: str,
     file_path: str,
@@ -304,18 +328,14 @@ async def process_document_with_graph(
                     results["relationships_extracted"] += len(extraction_result["relationships"])
 
                     # Create entity nodes
-                    for entity in extraction_result["entities"]:
-                        entity_id = graph_service.create_or_merge_entity(
-                            name=entity.get("name", ""),
-                            entity_type=entity.get("type", "OTHER"),
-                            description=entity.get("description", ""),
-                            confidence=entity.get("confidence", 0.8),
+                    entity_ids = graph_service.bulk_create_entities(
+                        _entity_rows(extraction_result["entities"])
+                    )
+                    for entity_id in entity_ids:
+                        graph_service.create_mention_relationship(
+                            entity_id=entity_id,
+                            textunit_id=chunk_id,
                         )
-                        if entity_id:
-                            graph_service.create_mention_relationship(
-                                entity_id=entity_id,
-                                textunit_id=chunk_id,
-                            )
 
                     # Create relationship edges
                     for rel in extraction_result["relationships"]:
@@ -349,21 +369,16 @@ async def process_document_with_graph(
                     results["entities_extracted"] += len(result["entities"])
 
                     # Create entity nodes in graph
-                    for entity in result["entities"]:
-                        entity_id = graph_service.create_or_merge_entity(
-                            name=entity.get("name", ""),
-                            entity_type=entity.get("type", "OTHER"),
-                            description=entity.get("description", ""),
-                            confidence=entity.get("confidence", 0.8),
+                    entity_ids = graph_service.bulk_create_entities(
+                        _entity_rows(result["entities"])
+                    )
+                    for entity_id in entity_ids:
+                        # Link entity to text unit
+                        graph_service.create_mention_relationship(
+                            entity_id=entity_id,
+                            textunit_id=chunk_id,
                         )
 
-                        if entity_id:
-                            # Link entity to text unit
-                            graph_service.create_mention_relationship(
-                                entity_id=entity_id,
-                                textunit_id=chunk_id,
-                            )
-
             # Step 8: Extract relationships (legacy path)
             chunk_with_entities = [
                 (chunk_text, all_entities_by_chunk.get(chunk_id, []), chunk_id)
@@ -598,6 +613,7 @@ async def process_document_with_graph(
         document.status = "completed"
         document.processing_progress = 100
         db.commit()
+        cache_service.bump_graph_version()
 
         results["status"] = "success"
         logger.info(f"✅ Document {document_id} processed successfully")
@@ -765,6 +781,7 @@ async def process_document_incrementally(
         logger.info("Step 7: Updating document metadata...")
         document.last_processed_at = datetime.utcnow()
         db.commit()
+        cache_service.bump_graph_version()
 
         # Merge results
         results.update(processing_results)
@@ -3,6 +3,7 @@ Entity Resolution Service for GraphRAG
 Handles entity deduplication, disambiguation, and merging using fuzzy matching and LLM
 """
 
+import functools
 import hashlib
 import logging
 from difflib import SequenceMatcher
@@ -11,6 +12,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import google.generativeai as genai
 
 from app.config import get_settings
+from app.services.cache_service import cache_service
 from app.services.graph_service import graph_service
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,12 @@ if settings.GOOGLE_API_KEY:
     genai.configure(api_key=settings.GOOGLE_API_KEY)
 
 
+@functools.lru_cache(maxsize=8192)
+def _raw_similarity(s1: str, s2: str) -> float:
+    """SequenceMatcher ratio for already-normalized strings, memoized per ordered pair"""
+    return SequenceMatcher(None, s1, s2).ratio()
+
+
 class EntityResolutionService:
     """Service for entity resolution, deduplication, and disambiguation"""
 
@@ -53,8 +61,10 @@ class EntityResolutionService:
         if s1 == s2:
             return 1.0
 
-        # Use SequenceMatcher for fuzzy matching
-        return SequenceMatcher(None, s1, s2).ratio()
+        # Use SequenceMatcher for fuzzy matching; names recur across duplicate scans,
+        # so pairs are memoized. The pair is not sorted because ratio() is not
+        # symmetric in every case.
+        return _raw_similarity(s1, s2)
 
     def find_similar_entities(
         self,
@@ -479,6 +489,8 @@ Respond in JSON format:
             logger.info(
                 f"Successfully merged {merged_count} entities into {primary_entity_id}"
             )
+            if merged_count:
+                cache_service.bump_graph_version()
 
             return {
                 "status": "success",
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from neo4j import Session
 
 from app.db.neo4j import get_neo4j_session
+from app.services.cache_service import cache_service
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,8 @@ class GraphService:
                 "CREATE CONSTRAINT textunit_id IF NOT EXISTS FOR (t:TextUnit) REQUIRE t.id IS UNIQUE",
                 "CREATE CONSTRAINT community_id IF NOT EXISTS FOR (c:Community) REQUIRE c.id IS UNIQUE",
                 "CREATE CONSTRAINT claim_id IF NOT EXISTS FOR (c:Claim) REQUIRE c.id IS UNIQUE",
+                # Id lookups ({id: $x}, id IN $ids) resolve via unique index seeks
+                "CREATE CONSTRAINT document_node_id IF NOT EXISTS FOR (d:Document) REQUIRE d.id IS UNIQUE",
             ]
 
             for constraint in constraints:
@@ -54,12 +57,16 @@ class GraphService:
 
             # Create indexes for performance
             indexes = [
+                # Entity.id is a case-folded hash of (name, type) while entities MERGE on the
+                # case-sensitive pair, so it is not unique: index it, don't constrain it
+                "CREATE INDEX entity_node_id IF NOT EXISTS FOR (e:Entity) ON (e.id)",
             "CREATE INDEX entity_type IF NOT EXISTS FOR (e:Entity) ON (e.type)",
             "CREATE INDEX textunit_doc_id IF NOT EXISTS FOR (t:TextUnit) ON (t.document_id)",
             "CREATE INDEX entity_confidence IF NOT EXISTS FOR (e:Entity) ON (e.confidence)",
             "CREATE INDEX relationship_type IF NOT EXISTS FOR (r:MENTIONED_IN) ON (r.type)",
             "CREATE INDEX claim_type IF NOT EXISTS FOR (c:Claim) ON (c.claim_type)",
             "CREATE INDEX claim_status IF NOT EXISTS FOR (c:Claim) ON (c.status)",
+            "CREATE INDEX community_level IF NOT EXISTS FOR (c:Community) ON (c.level)",
                 # ToG-specific indexes for optimized traversal
                 "CREATE INDEX entity_name_lookup IF NOT EXISTS FOR (e:Entity) ON (e.name)",
                 "CREATE INDEX entity_document IF NOT EXISTS FOR (e:Entity) ON (e.document_id)",
@@ -248,6 +255,102 @@ class GraphService:
             logger.error(f"Entity creation error: {e}")
             return None
 
+    def bulk_create_entities(
+        self, entities: List[Dict[str, Any]], session: Optional[Session] = None
+    ) -> List[str]:
+        """
+        Create or merge many entity nodes in one round-trip
+
+        Same deduplication and ID scheme as create_or_merge_entity, applied to every
+        row through a single UNWIND.
+
+        Args:
+            entities: Dicts with name, type, description and optional confidence
+            session: Existing session to reuse; a new one is opened if omitted
+
+        Returns:
+            Entity IDs in input order, or an empty list on failure
+        """
+        owned_session = session is None
+        session = session or self.get_session()
+        try:
+            rows = []
+            for entity in entities:
+                entity_key = f"{entity['name'].lower().strip()}:{entity['type'].lower()}"
+                rows.append(
+                    {
+                        "name": entity["name"],
+                        "entity_type": entity["type"],
+                        "entity_id": hashlib.md5(entity_key.encode()).hexdigest()[:16],
+                        "description": entity.get("description", ""),
+                        "confidence": entity.get("confidence", 0.8),
+                    }
+                )
+
+            query = """
+            UNWIND $rows AS row
+            MERGE (e:Entity {
+                name: row.name,
+                type: row.entity_type
+            })
+            ON CREATE SET
+                e.id = row.entity_id,
+                e.description = row.description,
+                e.confidence = row.confidence,
+                e.created_at = datetime(),
+                e.mention_count = 1
+            ON MATCH SET
+                e.mention_count = e.mention_count + 1,
+                e.updated_at = datetime(),
+                e.confidence = CASE WHEN row.confidence > e.confidence THEN row.confidence ELSE e.confidence END
+            RETURN e.id as id
+            """
+
+            result = session.run(query, rows=rows)
+            return [record["id"] for record in result]
+
+        except Exception as e:
+            logger.error(f"Bulk entity creation error: {e}")
+            return []
+        finally:
+            if owned_session:
+                session.close()
+
+    def bulk_delete_entities(self, entity_ids: List[str], session: Optional[Session] = None) -> int:
+        """
+        Detach and delete entity nodes by ID in one round-trip
+
+        Args:
+            entity_ids: Entity IDs to delete
+            session: Existing session to reuse; a new one is opened if omitted
+
+        Returns:
+            Number of nodes deleted
+        """
+        if not entity_ids:
+            return 0
+
+        owned_session = session is None
+        session = session or self.get_session()
+        try:
+            query = """
+            UNWIND $ids AS entity_id
+            MATCH (e:Entity {id: entity_id})
+            DETACH DELETE e
+            """
+
+            summary = session.run(query, ids=list(entity_ids)).consume()
+            if summary.counters.nodes_deleted:
+                cache_service.bump_graph_version()
+            return summary.counters.nodes_deleted
+
+        except Exception as e:
+            logger.error(f"Bulk entity deletion error: {e}")
+            return 0
+        finally:
+            if owned_session:
+                session.close()
+
     def create_mention_relationship(
         self,
         entity_id: str,
@@ -597,20 +700,33 @@ class GraphService:
         try:
             session = self.get_session()
 
-            queries = {
-                "documents": "MATCH (d:Document) RETURN count(d) as count",
-                "textunits": "MATCH (t:TextUnit) RETURN count(t) as count",
-                "entities": "MATCH (e:Entity) RETURN count(e) as count",
-                "relationships": "MATCH ()-[r]->() WHERE r:RELATED_TO OR r:MENTIONS OR r:CAUSES OR r:SUPPORTS OR r:OPPOSES RETURN count(r) as count",
+            # One round-trip; each independent count is answered from Neo4j's count
+            # store. Relationship types are counted separately and summed because a
+            # type disjunction in WHERE forces a scan of every relationship.
+            query = """
+            CALL { MATCH (d:Document) RETURN count(d) AS documents }
+            CALL { MATCH (t:TextUnit) RETURN count(t) AS textunits }
+            CALL { MATCH (e:Entity) RETURN count(e) AS entities }
+            CALL {
+                MATCH ()-[r:RELATED_TO]->() RETURN count(r) AS type_count
+                UNION ALL
+                MATCH ()-[r:MENTIONS]->() RETURN count(r) AS type_count
+                UNION ALL
+                MATCH ()-[r:CAUSES]->() RETURN count(r) AS type_count
+                UNION ALL
+                MATCH ()-[r:SUPPORTS]->() RETURN count(r) AS type_count
+                UNION ALL
+                MATCH ()-[r:OPPOSES]->() RETURN count(r) AS type_count
             }
+            WITH documents, textunits, entities, sum(type_count) AS relationships
+            RETURN documents, textunits, entities, relationships
+            """
 
-            stats = {}
-            for key, query in queries.items():
-                result = session.run(query)
-                record = result.single()
-                stats[key] = record["count"] if record else 0
+            record = session.run(query).single()
+            if not record:
+                return {"documents": 0, "textunits": 0, "entities": 0, "relationships": 0}
 
-            return stats
+            return dict(record)
 
         except Exception as e:
             logger.error(f"Graph statistics error: {e}")
@@ -1071,6 +1187,7 @@ class GraphService:
     def delete_document_graph_data(
         self,
         document_id: str,
+        session: Optional[Session] = None,
     ) -> Dict[str, Any]:
         """
         Delete all graph data associated with a document
@@ -1083,13 +1200,14 @@ class GraphService:
 
         Args:
             document_id: Document ID
+            session: Existing session to reuse; a new one is opened if omitted
 
         Returns:
             Dictionary with deletion statistics
         """
+        owned_session = session is None
+        session = session or self.get_session()
         try:
-            session = self.get_session()
-
             # Step 1: Delete claims sourced from this document's text units
             claims_query = """
             MATCH (d:Document {id: $document_id})<-[:PART_OF]-(t:TextUnit)
@@ -1115,20 +1233,7 @@ class GraphService:
             orphan_count = orphan_result["orphan_count"] if orphan_result else 0
 
             # Step 3: Delete orphaned entities and their relationships
-            if orphan_entity_ids:
-                delete_orphans_query = """
-                MATCH (e:Entity)
-                WHERE e.id IN $orphan_ids
-                DETACH DELETE e
-                RETURN COUNT(e) AS entities_deleted
-                """
-                orphans_result = session.run(
-                    delete_orphans_query,
-                    orphan_ids=orphan_entity_ids
-                ).single()
-                entities_deleted = orphans_result["entities_deleted"] if orphans_result else 0
-            else:
-                entities_deleted = 0
+            entities_deleted = self.bulk_delete_entities(orphan_entity_ids, session=session)
 
             # Step 4: For non-orphaned entities, just remove the MENTIONED_IN relationships
             # to this document's text units and decrement mention_count
@@ -1165,6 +1270,7 @@ class GraphService:
                 f"{textunits_deleted} text units, {entities_deleted} orphaned entities, "
                 f"{entities_updated} entities updated, {claims_deleted} claims"
             )
+            cache_service.bump_graph_version()
 
             return {
                 "status": "success",
@@ -1184,6 +1290,9 @@ class GraphService:
                 "entities_affected": 0,
                 "claims_deleted": 0,
             }
+        finally:
+            if owned_session:
+                session.close()
 
     def update_entity(
         self,
@@ -1092,7 +1092,7 @@ class LLMService:
         # Convert back to list, joining descriptions
         result = []
         for key, data in entity_map.items():
-            unique_descriptions = list(set(d for d in data["descriptions"] if d.strip()))
+            unique_descriptions = list({d for d in data["descriptions"] if d.strip()})
             result.append({
                 "name": data["name"],
                 "type": data["type"],
@@ -1142,7 +1142,7 @@ class LLMService:
 
         result = []
         for key, data in rel_map.items():
-            unique_descriptions = list(set(d for d in data["descriptions"] if d.strip()))
+            unique_descriptions = list({d for d in data["descriptions"] if d.strip()})
             result.append({
                 "source": data["source"],
                 "target": data["target"],
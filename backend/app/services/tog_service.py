@@ -7,11 +7,13 @@ Based on the ToG methodology adapted for GraphRAG knowledge graphs.
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set, Tuple
 from difflib import SequenceMatcher
 import re
 
+from app.services.cache_service import cache_service
 from app.services.graph_service import GraphService
 from app.services.llm_service import LLMService
 from app.services.prompt import (
@@ -101,29 +103,28 @@ class ToGReasoningStep:
     relations_selected: List[ToGRelation]
     sufficiency_score: Optional[float] = None
     reasoning_notes: Optional[str] = None
+    _name_set: Optional[Set[str]] = field(default=None, init=False, repr=False, compare=False)
 
+    def entity_names(self) -> Set[str]:
+        """Names of explored entities, built once and reused by later cycle checks."""
+        if self._name_set is None:
+            self._name_set = {e.name for e in self.entities_explored}
+        return self._name_set
 
-@dataclass
+
+@dataclass(frozen=True)
 class ToGTriplet:
-    """Knowledge triplet extracted during ToG reasoning."""
+    """Knowledge triplet extracted during ToG reasoning.
+
+    Immutable and hashed on (subject, relation, object) only, so duplicates
+    collapse on insertion into a set.
+    """
 
     subject: str
     relation: str
     object: str
-    confidence: float = 1.0
-    source: Optional[str] = None  # Source of the triplet (e.g., document, step)
-
-    def __hash__(self):
-        return hash((self.subject, self.relation, self.object))
-
-    def __eq__(self, other):
-        if not isinstance(other, ToGTriplet):
-            return False
-        return (
-            self.subject == other.subject
-            and self.relation == other.relation
-            and self.object == other.object
-        )
+    confidence: float = field(default=1.0, compare=False)
+    source: Optional[str] = field(default=None, compare=False)  # Source of the triplet (e.g., document, step)
 
 
 @dataclass
@@ -147,6 +148,12 @@ class ToGService:
     3. Evaluate sufficiency and generate final answer
     """
 
+    # Available entity names per document filter, shared across instances and dropped
+    # whenever the graph version moves: {frozenset(document_ids): (names, fetched_at)}
+    _entities_cache: Dict[frozenset, Tuple[List[str], float]] = {}
+    _entities_cache_version: Optional[int] = None
+    ENTITY_CACHE_TTL = 60  # seconds, also bounds staleness while Redis is unreachable
+
     def __init__(self, graph_service: GraphService, llm_service: LLMService):
         """Initialize ToG service with dependencies."""
         self.graph_service = graph_service
@@ -239,7 +246,24 @@ class ToGService:
         return validated_entities
 
     def _get_available_entities(self, document_ids: Optional[List[int]]) -> List[str]:
-        """Get entity names from graph, optionally filtered by documents."""
+        """Get entity names from graph, optionally filtered by documents (memoized per version)."""
+        # Every write path that adds, deletes or merges entities bumps the graph version
+        version = cache_service.get_graph_version()
+        if version != ToGService._entities_cache_version:
+            ToGService._entities_cache.clear()
+            ToGService._entities_cache_version = version
+
+        cache_key = frozenset(document_ids or ())
+        cached = self._entities_cache.get(cache_key)
+        if cached and time.monotonic() - cached[1] < self.ENTITY_CACHE_TTL:
+            return cached[0]
+
+        entities = self._fetch_available_entities(document_ids)
+        self._entities_cache[cache_key] = (entities, time.monotonic())
+        return entities
+
+    def _fetch_available_entities(self, document_ids: Optional[List[int]]) -> List[str]:
+        """Query entity names from graph, optionally filtered by documents."""
         query = """
         MATCH (e:Entity)
         """
@@ -268,13 +292,18 @@ class ToGService:
         target_lower = target_entity.lower()
 
         best_match = None
-        best_score = 0.0
+        best_score = 0.8  # High threshold for fuzzy matching
 
+        matcher = SequenceMatcher(None, target_lower)
         for entity in available_entities:
-            entity_lower = entity.lower()
-            score = SequenceMatcher(None, target_lower, entity_lower).ratio()
+            matcher.set_seq2(entity.lower())
+
+            # Cheap upper bounds first; only compute the full ratio when it could win
+            if matcher.real_quick_ratio() <= best_score or matcher.quick_ratio() <= best_score:
+                continue
 
-            if score > best_score and score > 0.8:  # High threshold for fuzzy matching
+            score = matcher.ratio()
+            if score > best_score:
                 best_score = score
                 best_match = entity
 
@@ -284,34 +313,49 @@ class ToGService:
         self, question: str, available_entities: List[str], top_k: int = 3
     ) -> List[str]:
         """Fuzzy match question tokens to entity names."""
-        # Tokenize question (simple approach)
         question_lower = question.lower()
+
+        # Fast path: entity names contained verbatim in the question score 1.0
+        exact_matches = [
+            entity for entity in available_entities if entity.lower() in question_lower
+        ]
+        if len(exact_matches) >= top_k:
+            matched = exact_matches[:top_k]
+            logger.info(f"Fuzzy matched entities from question: {matched}")
+            return matched
+
+        # Tokenize question (simple approach)
         words = re.findall(r"\w+", question_lower)
 
         # Filter to meaningful words
         meaningful_words = [word for word in words if len(word) > 2]
 
-        # Score each entity
+        # Score remaining entities to top up the exact matches
+        exact_set = set(exact_matches)
         entity_scores = []
         for entity in available_entities:
-            entity_lower = entity.lower()
+            if entity in exact_set:
+                continue
+
             max_score = 0.0
 
-            # Check if entity name appears in question
-            if entity_lower in question_lower:
-                max_score = 1.0
-            else:
-                # Fuzzy match against question words
-                for word in meaningful_words:
-                    score = SequenceMatcher(None, word, entity_lower).ratio()
-                    max_score = max(max_score, score)
+            # Fuzzy match against question words, reusing the matcher's index of the entity
+            matcher = SequenceMatcher(None, b=entity.lower())
+            for word in meaningful_words:
+                matcher.set_seq1(word)
+                floor = max(max_score, 0.6)
+                if matcher.real_quick_ratio() <= floor or matcher.quick_ratio() <= floor:
+                    continue
+                max_score = max(max_score, matcher.ratio())
 
             if max_score > 0.6:  # Threshold
                 entity_scores.append((entity, max_score))
 
         # Sort and return top-k
         entity_scores.sort(key=lambda x: x[1], reverse=True)
-        matched = [entity for entity, score in entity_scores[:top_k]]
+        matched = exact_matches + [
+            entity for entity, score in entity_scores[: top_k - len(exact_matches)]
+        ]
 
         logger.info(f"Fuzzy matched entities from question: {matched}")
         return matched
@@ -882,8 +926,6 @@ Only return valid JSON, no additional text."""
         """
         Safe wrapper for process_query with comprehensive error handling and fallbacks.
         """
-        import time
-
         start_time = time.time()
 
         try:
@@ -1090,12 +1132,11 @@ Only return valid JSON, no additional text."""
             return False
 
         # Check if current entities overlap significantly with previous steps
-        current_names = set(e.name for e in current_entities)
-        next_names = set(e.name for e in next_entities)
+        current_names = {e.name for e in current_entities}
 
         # Check overlap with last step
         if len(self.reasoning_path.steps) >= 1:
-            prev_names = set(e.name for e in self.reasoning_path.steps[-1].entities_explored)
+            prev_names = self.reasoning_path.steps[-1].entity_names()
             overlap = len(current_names & prev_names)
             if overlap / max(len(current_names), 1) > 0.8:
                 return True
@@ -1106,8 +1147,6 @@ Only return valid JSON, no additional text."""
         self, question: str, config: ToGConfig, start_time: float
     ) -> ToGReasoningPath:
         """Fallback reasoning when main process fails."""
-        import time
-
         logger.info("Using fallback reasoning strategy")
 
         # Create a basic reasoning path
@@ -5,12 +5,89 @@ Generates visualization data (nodes, edges, metadata) for displaying ToG reasoni
 in frontend components like graph visualizations or reasoning trees.
 """
 
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from collections import defaultdict
+from itertools import groupby
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 
+# Node color by depth at which the entity was first seen
+_DEPTH_COLORS = (
+    "#4CAF50",  # Green - starting entities
+    "#2196F3",  # Blue - depth 1
+    "#FF9800",  # Orange - depth 2
+    "#F44336",  # Red - depth 3
+    "#9C27B0",  # Purple - deeper
+)
+_MAX_DEPTH_IDX = len(_DEPTH_COLORS) - 1
+
+# Node shape by entity type (anything else is drawn as a circle)
+_TYPE_TO_SHAPE = {
+    "PERSON": "circle",
+    "ORGANIZATION": "square",
+    "GEO": "triangle",
+    "LOCATION": "triangle",
+    "EVENT": "diamond",
+}
+
+
+@dataclass(slots=True)
+class VizNode:
+    """Visualization node; converted to a dict only when the payload is returned."""
+
+    id: str
+    label: str
+    type: str
+    description: Optional[str]
+    confidence: float
+    depth: int
+    document_id: Optional[int]
+
+    # Visualization properties
+    color: str
+    size: float
+    shape: str
+    group: str
+
+
+@dataclass(slots=True)
+class VizEdge:
+    """Visualization edge; converted to a dict only when the payload is returned."""
+
+    id: str
+    source: str
+    target: str
+    label: str
+    confidence: float
+    source_step: str
+
+    # Visualization properties
+    color: str
+    width: int
+    type: str
+    curved: bool = True
+
+
+def _to_payload(element: Any) -> Dict[str, Any]:
+    """Flat dict of a slotted VizNode/VizEdge, omitting null-valued keys.
+
+    Fields are all scalars, so this skips the recursive deep copy asdict() makes.
+    """
+    return {
+        key: value
+        for key in element.__slots__
+        if (value := getattr(element, key)) is not None
+    }
+
+
+def _edge_id(*parts: str) -> str:
+    """Stable fixed-width ID for an edge, safe for names containing underscores."""
+    return hashlib.blake2b("\x1f".join(parts).encode(), digest_size=8).hexdigest()
+
 
 class ToGVisualizationService:
     """Service for generating visualization data from ToG reasoning paths."""
@@ -35,8 +112,9 @@ class ToGVisualizationService:
         """
         try:
             # Extract all entities and relations from reasoning path
-            entities = self._extract_entities_from_path(reasoning_path)
-            relations = self._extract_relations_from_path(reasoning_path)
+            outgoing, incoming = self._index_triplets(reasoning_path)
+            entities = self._extract_entities_from_path(reasoning_path, outgoing, incoming)
+            relations = self._extract_relations_from_path(reasoning_path, outgoing)
 
             # Generate visualization nodes and edges
             nodes = self._create_visualization_nodes(entities, reasoning_path)
@@ -51,8 +129,8 @@ class ToGVisualizationService:
             layout = self._generate_layout_hints(nodes, edges, reasoning_path)
 
             return {
-                "nodes": nodes,
-                "edges": edges,
+                "nodes": [_to_payload(node) for node in nodes],
+                "edges": [_to_payload(edge) for edge in edges],
                 "metadata": metadata,
                 "layout": layout,
                 "question": question
@@ -62,156 +140,136 @@ class ToGVisualizationService:
             logger.error(f"Failed to generate visualization data: {e}")
             return self._create_error_visualization(question, str(e))
 
-    def _extract_entities_from_path(self, reasoning_path) -> List[Dict[str, Any]]:
+    def _index_triplets(
+        self, reasoning_path
+    ) -> Tuple[Dict[str, List[Any]], Dict[str, List[Any]]]:
+        """Index retrieved triplets by subject (outgoing) and by object (incoming)."""
+        outgoing = defaultdict(list)
+        incoming = defaultdict(list)
+
+        for triplet in getattr(reasoning_path, "retrieved_triplets", ()):
+            outgoing[triplet.subject].append(triplet)
+            incoming[triplet.object].append(triplet)
+
+        return outgoing, incoming
+
+    def _extract_entities_from_path(
+        self,
+        reasoning_path,
+        outgoing: Dict[str, List[Any]],
+        incoming: Dict[str, List[Any]],
+    ) -> List[Dict[str, Any]]:
         """Extract all unique entities from reasoning path."""
         entities = {}
+        get_fields = attrgetter("id", "name", "type", "description", "confidence", "document_id")
 
         # Extract from reasoning steps
         for step in reasoning_path.steps:
+            depth = step.depth
             for entity in step.entities_explored:
-                entity_key = entity.id
+                entity_id, name, entity_type, description, confidence, document_id = get_fields(
+                    entity
+                )
+                if entity_id not in entities:
+                    entities[entity_id] = {
+                        "id": entity_id,
+                        "name": name,
+                        "type": entity_type,
+                        "description": description,
+                        "confidence": confidence,
+                        "first_seen_depth": depth,
+                        "document_id": document_id
+                    }
+
+        # Create placeholder entities for triplet subjects/objects (in case some aren't in steps)
+        for index in (outgoing, incoming):
+            for entity_name, triplets in index.items():
+                entity_key = f"triplet_{entity_name}"
                 if entity_key not in entities:
                     entities[entity_key] = {
-                        "id": entity.id,
-                        "name": entity.name,
-                        "type": entity.type,
-                        "description": entity.description,
-                        "confidence": entity.confidence,
-                        "first_seen_depth": step.depth,
-                        "document_id": entity.document_id
+                        "id": entity_key,
+                        "name": entity_name,
+                        "type": "UNKNOWN",
+                        "description": f"Entity from triplet: {entity_name}",
+                        "confidence": triplets[0].confidence,
+                        "first_seen_depth": 0,
+                        "document_id": None
                     }
 
-        # Extract from triplets (in case some entities aren't in steps)
-        if hasattr(reasoning_path, 'retrieved_triplets'):
-            for triplet in reasoning_path.retrieved_triplets:
-                # Create placeholder entities for subjects/objects not in steps
-                for entity_name in [triplet.subject, triplet.object]:
-                    entity_key = f"triplet_{entity_name}"
-                    if entity_key not in entities:
-                        entities[entity_key] = {
-                            "id": entity_key,
-                            "name": entity_name,
-                            "type": "UNKNOWN",
-                            "description": f"Entity from triplet: {entity_name}",
-                            "confidence": triplet.confidence,
-                            "first_seen_depth": 0,
-                            "document_id": None
-                        }
-
         return list(entities.values())
 
-    def _extract_relations_from_path(self, reasoning_path) -> List[Dict[str, Any]]:
+    def _extract_relations_from_path(
+        self, reasoning_path, outgoing: Dict[str, List[Any]]
+    ) -> List[Dict[str, Any]]:
         """Extract all relations from reasoning path."""
         relations = []
+        seen_ids = set()
 
-        # Extract from triplets
-        if hasattr(reasoning_path, 'retrieved_triplets'):
-            for triplet in reasoning_path.retrieved_triplets:
+        # Extract from triplets, grouped by subject
+        for triplets in outgoing.values():
+            for triplet in triplets:
+                relation_id = _edge_id(triplet.subject, triplet.relation, triplet.object)
+                seen_ids.add(relation_id)
                 relations.append({
                     "source": triplet.subject,
                     "target": triplet.object,
                     "type": triplet.relation,
                     "confidence": triplet.confidence,
                     "source_step": triplet.source or "unknown",
-                    "id": f"{triplet.subject}_{triplet.relation}_{triplet.object}"
+                    "id": relation_id
                 })
 
         # Extract from reasoning steps
         for step in reasoning_path.steps:
             for relation in step.relations_selected:
-                # Check if this relation is already in triplets
-                existing = any(
-                    r["source"] == relation.source_entity.name and
-                    r["target"] == relation.target_entity.name and
-                    r["type"] == relation.type
-                    for r in relations
-                )
+                source_name = relation.source_entity.name
+                target_name = relation.target_entity.name
+                relation_id = _edge_id(source_name, relation.type, target_name)
 
-                if not existing:
+                # Skip relations already present (e.g. from triplets)
+                if relation_id not in seen_ids:
+                    seen_ids.add(relation_id)
                     relations.append({
-                        "source": relation.source_entity.name,
-                        "target": relation.target_entity.name,
+                        "source": source_name,
+                        "target": target_name,
                         "type": relation.type,
                         "confidence": relation.confidence,
                         "source_step": f"depth_{step.depth}",
-                        "id": f"{relation.source_entity.name}_{relation.type}_{relation.target_entity.name}"
+                        "id": relation_id
                     })
 
         return relations
 
     def _create_visualization_nodes(
         self, entities: List[Dict[str, Any]], reasoning_path
-    ) -> List[Dict[str, Any]]:
+    ) -> List[VizNode]:
         """Create visualization nodes with styling and positioning hints."""
         nodes = []
-
-        # Group entities by depth for coloring/layout
-        depth_groups = defaultdict(list)
-        for entity in entities:
-            depth = entity.get("first_seen_depth", 0)
-            depth_groups[depth].append(entity)
-
-        # Color scheme based on depth
-        depth_colors = [
-            "#4CAF50",  # Green - starting entities
-            "#2196F3",  # Blue - depth 1
-            "#FF9800",  # Orange - depth 2
-            "#F44336",  # Red - depth 3
-            "#9C27B0",  # Purple - deeper
-        ]
-
         for entity in entities:
             depth = entity.get("first_seen_depth", 0)
-            color = depth_colors[min(depth, len(depth_colors) - 1)]
-
-            # Size based on confidence and type
-            base_size = 20
-            confidence_boost = entity.get("confidence", 0.5) * 10
-            size = base_size + confidence_boost
-
-            # Shape based on entity type
-            shape = "circle"
-            if entity.get("type") == "PERSON":
-                shape = "circle"
-            elif entity.get("type") == "ORGANIZATION":
-                shape = "square"
-            elif entity.get("type") in ["GEO", "LOCATION"]:
-                shape = "triangle"
-            elif entity.get("type") == "EVENT":
-                shape = "diamond"
-
-            node = {
-                "id": entity["id"],
-                "label": entity["name"],
-                "type": entity.get("type", "UNKNOWN"),
-                "description": entity.get("description", ""),
-                "confidence": entity.get("confidence", 0.5),
-                "depth": depth,
-                "document_id": entity.get("document_id"),
-
-                # Visualization properties
-                "color": color,
-                "size": size,
-                "shape": shape,
-                "group": f"depth_{depth}",
-
-                # Positioning hints
-                "x": None,  # Will be set by layout algorithm
-                "y": None,
-
-                # Interaction properties
-                "clickable": True,
-                "draggable": True,
-                "hoverable": True
-            }
-
-            nodes.append(node)
+            confidence = entity.get("confidence", 0.5)
+            entity_type = entity.get("type", "UNKNOWN")
+
+            # Color based on depth, size based on confidence
+            nodes.append(VizNode(
+                id=entity["id"],
+                label=entity["name"],
+                type=entity_type,
+                description=entity.get("description", ""),
+                confidence=confidence,
+                depth=depth,
+                document_id=entity.get("document_id"),
+                color=_DEPTH_COLORS[min(depth, _MAX_DEPTH_IDX)],
+                size=20 + confidence * 10,
+                shape=_TYPE_TO_SHAPE.get(entity_type, "circle"),
+                group=f"depth_{depth}",
+            ))
 
         return nodes
 
     def _create_visualization_edges(
         self, relations: List[Dict[str, Any]], reasoning_path
-    ) -> List[Dict[str, Any]]:
+    ) -> List[VizEdge]:
         """Create visualization edges with styling."""
         edges = []
 
@@ -245,26 +303,17 @@ class ToGVisualizationService:
             if "similar" in relation["type"].lower() or "related" in relation["type"].lower():
                 edge_type = "dashed"
 
-            edge = {
-                "id": relation["id"],
-                "source": source_id,
-                "target": target_id,
-                "label": relation["type"],
-                "confidence": confidence,
-                "source_step": relation.get("source_step", "unknown"),
-
-                # Visualization properties
-                "color": color,
-                "width": width,
-                "type": edge_type,
-                "curved": True,
-
-                # Interaction properties
-                "clickable": True,
-                "hoverable": True
-            }
-
-            edges.append(edge)
+            edges.append(VizEdge(
+                id=relation["id"],
+                source=source_id,
+                target=target_id,
+                label=relation["type"],
+                confidence=confidence,
+                source_step=relation.get("source_step", "unknown"),
+                color=color,
+                width=width,
+                type=edge_type,
+            ))
 
         return edges
 
@@ -272,10 +321,22 @@ class ToGVisualizationService:
         self, reasoning_path, question: str, node_count: int, edge_count: int
     ) -> Dict[str, Any]:
         """Create metadata for the visualization."""
+        # Gather step statistics in a single pass
+        entities_explored = 0
+        relations_selected = 0
+        sufficiency_total = 0
+        max_depth = 0
+        for step in reasoning_path.steps:
+            entities_explored += len(step.entities_explored)
+            relations_selected += len(step.relations_selected)
+            sufficiency_total += step.sufficiency_score or 0
+            if step.depth > max_depth:
+                max_depth = step.depth
+
         return {
             "question": question,
             "total_steps": len(reasoning_path.steps),
-            "max_depth": max((s.depth for s in reasoning_path.steps), default=0),
+            "max_depth": max_depth,
             "node_count": node_count,
             "edge_count": edge_count,
             "final_answer": reasoning_path.final_answer,
@@ -284,11 +345,9 @@ class ToGVisualizationService:
 
             # Statistics
             "statistics": {
-                "entities_explored": sum(len(s.entities_explored) for s in reasoning_path.steps),
-                "relations_selected": sum(len(s.relations_selected) for s in reasoning_path.steps),
-                "avg_sufficiency_score": sum(
-                    s.sufficiency_score or 0 for s in reasoning_path.steps
-                ) / max(len(reasoning_path.steps), 1)
+                "entities_explored": entities_explored,
+                "relations_selected": relations_selected,
+                "avg_sufficiency_score": sufficiency_total / max(len(reasoning_path.steps), 1)
             },
 
             # Visualization settings
@@ -296,19 +355,24 @@ class ToGVisualizationService:
                 "show_confidence": True,
                 "show_depth_colors": True,
                 "animate_steps": True,
-                "layout_algorithm": "force_directed"
+                "layout_algorithm": "force_directed",
+                # Applied by the frontend to every node/edge (positions come from the layout)
+                "default_node_interaction": {
+                    "clickable": True,
+                    "draggable": True,
+                    "hoverable": True
+                },
+                "default_edge_interaction": {
+                    "clickable": True,
+                    "hoverable": True
+                }
             }
         }
 
     def _generate_layout_hints(
-        self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]], reasoning_path
+        self, nodes: List[VizNode], edges: List[VizEdge], reasoning_path
     ) -> Dict[str, Any]:
         """Generate layout hints for better visualization."""
-        # Group nodes by depth for hierarchical layout
-        depth_groups = defaultdict(list)
-        for node in nodes:
-            depth_groups[node["depth"]].append(node)
-
         # Calculate positions for hierarchical layout
         layout = {
             "type": "hierarchical",
@@ -319,12 +383,13 @@ class ToGVisualizationService:
             "depth_levels": {}
         }
 
-        # Position nodes by depth
+        # Position nodes by depth (sorted once, then grouped in a single linear pass)
         y_start = 100
-        for depth, depth_nodes in depth_groups.items():
+        get_depth = attrgetter("depth")
+        for depth, depth_nodes in groupby(sorted(nodes, key=get_depth), key=get_depth):
             layout["depth_levels"][depth] = {
                 "y": y_start + (depth * 150),
-                "nodes": [node["id"] for node in depth_nodes]
+                "nodes": [node.id for node in depth_nodes]
             }
 
         return layout
@@ -363,16 +428,25 @@ class ToGVisualizationService:
         Returns:
             List of animation frames, each containing nodes/edges visible at that step
         """
-        frames = []
+        return list(self.iter_step_by_step_animation(reasoning_path, question))
+
+    def iter_step_by_step_animation(
+        self, reasoning_path, question: str
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield animation frames so callers can stream them one at a time.
 
+        Yields:
+            Animation frames, each containing nodes/edges newly visible at that step
+        """
         # Frame 0: Initial question
-        frames.append({
+        yield {
             "step": 0,
             "description": f"Question: {question}",
             "nodes": [],
             "edges": [],
             "highlight": None
-        })
+        }
 
         current_nodes = set()
         current_edges = set()
@@ -393,7 +467,7 @@ class ToGVisualizationService:
 
             # Add relations from this step
             for relation in step.relations_selected:
-                edge_id = f"{relation.source_entity.id}_{relation.type}_{relation.target_entity.id}"
+                edge_id = _edge_id(relation.source_entity.id, relation.type, relation.target_entity.id)
                 if edge_id not in current_edges:
                     current_edges.add(edge_id)
                     frame_edges.append({
@@ -402,13 +476,11 @@ class ToGVisualizationService:
                         "animation": "draw"
                     })
 
-            frames.append({
+            yield {
                 "step": step_idx + 1,
                 "description": f"Depth {step.depth}: Exploring {len(step.entities_explored)} entities",
                 "nodes": frame_nodes,
                 "edges": frame_edges,
                 "sufficiency_score": step.sufficiency_score,
                 "reasoning_notes": step.reasoning_notes
-            })
-
-        return frames
+            }
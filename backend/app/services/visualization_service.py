@@ -3,30 +3,125 @@ Graph visualization service for preparing data for frontend visualization
 Exports data in Cytoscape.js format
 """
 
+import asyncio
+import functools
+import hashlib
+import inspect
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from app.db.neo4j import get_neo4j_session
+from fastapi.concurrency import run_in_threadpool
+
+from app.db.neo4j import get_neo4j_async_session
+from app.services.cache_service import cache_service
 
 logger = logging.getLogger(__name__)
 
+# Node styles are built once and shared; Cytoscape never mutates them
+_NODE_STYLES: Dict[str, Dict[str, str]] = {
+    entity_type: {"background-color": color, "width": "50px", "height": "50px"}
+    for entity_type, color in {
+        "PERSON": "#FF6B6B",
+        "ORGANIZATION": "#4ECDC4",
+        "LOCATION": "#45B7D1",
+        "CONCEPT": "#96CEB4",
+        "EVENT": "#FFEAA7",
+        "PRODUCT": "#DDA15E",
+        "OTHER": "#C9ADA7",
+    }.items()
+}
+_DEFAULT_STYLE: Dict[str, str] = {
+    "background-color": "#999999",
+    "width": "50px",
+    "height": "50px",
+}
+
+_COMMUNITY_COLORS = (
+    "#FF6B6B",
+    "#4ECDC4",
+    "#45B7D1",
+    "#96CEB4",
+    "#FFEAA7",
+    "#DDA15E",
+    "#BC6C25",
+    "#9D4EDD",
+    "#5A189A",
+    "#3C096C",
+)
+
+
+def _cached_viz(ttl: int = 60) -> Callable:
+    """
+    Cache successful visualization payloads in Redis
+
+    Entries are keyed by method, bound arguments and the current graph version,
+    so ingestion invalidates them by bumping the version rather than deleting keys.
+    Calls go straight to Neo4j when Redis is unavailable. The Redis client is
+    synchronous, so its calls run in the threadpool to keep the event loop free.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs) -> Dict[str, Any]:
+            version = await run_in_threadpool(cache_service.get_graph_version)
+            if version is None:
+                return await func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = json.dumps(
+                {name: value for name, value in bound.arguments.items() if name != "self"},
+                sort_keys=True,
+                default=str,
+            )
+            digest = hashlib.blake2b(params.encode(), digest_size=8).hexdigest()
+            key = f"{func.__name__}:{version}:{digest}"
+
+            cached = await run_in_threadpool(cache_service.get_cached_visualization, key)
+            if cached is not None:
+                return cached
+
+            result = await func(self, *args, **kwargs)
+            if result.get("status") == "success":
+                await run_in_threadpool(cache_service.cache_visualization, key, result, ttl)
+            return result
+
+        return wrapper
+
+    return decorator
+
 
 class VisualizationService:
     """Service for graph visualization data preparation"""
 
     def __init__(self):
         """Initialize visualization service"""
-        self.session = None
+        pass
 
-    def get_session(self):
-        """Get or create Neo4j session"""
-        if not self.session:
-            self.session = get_neo4j_session()
-        return self.session
+    async def _run_read(
+        self, query: str, convert: Callable, params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Run a read query in its own session, converting records as they stream in
 
-    def get_entity_graph(
-        self, limit: int = 100, include_communities: bool = True
+        Each call gets a separate session so independent queries can run concurrently.
+        """
+
+        async def work(tx):
+            return await convert(await tx.run(query, params or {}))
+
+        async with get_neo4j_async_session() as session:
+            return await session.execute_read(work)
+
+    @_cached_viz(ttl=60)
+    async def get_entity_graph(
+        self,
+        limit: int = 100,
+        include_communities: bool = True,
+        include_inline_style: bool = False,
     ) -> Dict[str, Any]:
         """
         Get entity graph for visualization
@@ -34,74 +129,54 @@ class VisualizationService:
         Args:
             limit: Maximum number of entities to include
             include_communities: Whether to include community nodes
+            include_inline_style: Whether to attach a per-node `style` (clients with a
+                stylesheet keyed on `classes` don't need it)
 
         Returns:
             Dictionary with nodes and edges for Cytoscape.js
         """
         try:
-            session = self.get_session()
-
-            # Get entities
-            entity_query = f"""
+            # Get entities together with the relationships among them in one round-trip
+            entity_graph_query = """
             MATCH (e:Entity)
-            OPTIONAL MATCH (e)-[r:IN_COMMUNITY]->(c:Community)
+            OPTIONAL MATCH (e)-[:IN_COMMUNITY]->(c:Community)
+            WITH e, c
+            LIMIT $limit
+            WITH collect({entity: e, community_id: c.id}) AS rows, collect(e.id) AS entity_ids
+            UNWIND rows AS row
+            WITH row.entity AS e, row.community_id AS community_id, entity_ids
+            OPTIONAL MATCH (e)-[r]-(other:Entity)
+            WHERE other.id IN entity_ids
             RETURN
                 e.id AS id,
-                e.name AS label,
-                e.type AS type,
-                e.description AS description,
-                c.id AS community_id
-            LIMIT {limit}
-            """
-
-            entities = session.run(entity_query).data()
-
-            # Get relationships
-            rel_query = """
-            MATCH (e1:Entity)-[r]-(e2:Entity)
-            WHERE e1.id IN $entity_ids AND e2.id IN $entity_ids
-            RETURN
-                e1.id AS source,
-                e2.id AS target,
-                type(r) AS type,
-                r.description AS description,
-                r.confidence AS confidence
-            """
-
-            entity_ids = [e["id"] for e in entities]
-
-            relationships = session.run(rel_query, {"entity_ids": entity_ids}).data()
-
-            # Convert to Cytoscape format
-            nodes = []
-            for entity in entities:
-                node = {
-                    "data": {
-                        "id": entity["id"],
-                        "label": entity["label"],
-                        "type": entity["type"],
-                        "description": entity["description"] or "",
-                        "community_id": entity.get("community_id"),
+                {
+                    data: {
+                        id: e.id,
+                        label: e.name,
+                        type: e.type,
+                        description: substring(coalesce(e.description, ""), 0, 200),
+                        community_id: community_id
                     },
-                    "classes": f"entity {entity['type'].lower()}",
-                    "style": self._get_node_style(entity["type"]),
-                }
-                nodes.append(node)
+                    classes: "entity " + toLower(e.type)
+                } AS node,
+                collect(
+                    CASE WHEN r IS NOT NULL THEN {
+                        target: other.id,
+                        type: type(r),
+                        description: r.description,
+                        confidence: r.confidence
+                    } END
+                ) AS relationships
+            """
 
-            edges = []
-            for rel in relationships:
-                edge = {
-                    "data": {
-                        "id": f"{rel['source']}-{rel['target']}",
-                        "source": rel["source"],
-                        "target": rel["target"],
-                        "label": rel["type"],
-                        "description": rel.get("description", ""),
-                        "confidence": rel.get("confidence", 0.5),
-                    },
-                    "classes": f"relationship {rel['type'].lower()}",
-                }
-                edges.append(edge)
+            # Records are converted as they stream in rather than buffered via .data()
+            nodes, edges = await self._run_read(
+                entity_graph_query,
+                functools.partial(
+                    self._entity_graph_elements, include_inline_style=include_inline_style
+                ),
+                {"limit": int(limit)},
+            )
 
             return {
                 "status": "success",
@@ -114,8 +189,12 @@ class VisualizationService:
             logger.error(f"Failed to get entity graph: {str(e)}")
             return {"status": "error", "message": str(e)}
 
-    def get_community_graph(
-        self, include_members: bool = True, max_members: int = 10
+    @_cached_viz(ttl=60)
+    async def get_community_graph(
+        self,
+        include_members: bool = True,
+        max_members: int = 10,
+        include_inline_style: bool = False,
     ) -> Dict[str, Any]:
         """
         Get community graph for visualization
@@ -123,78 +202,51 @@ class VisualizationService:
         Args:
             include_members: Whether to include entity members in nodes
             max_members: Maximum members per community to show
+            include_inline_style: Whether to attach a per-node `style` (clients can map
+                `data(size)` to width/height in their stylesheet instead)
 
         Returns:
             Dictionary with nodes and edges for Cytoscape.js
         """
         try:
-            session = self.get_session()
-
-            # Get communities
+            # Get communities, trimming long text columns before they cross the wire
             community_query = """
             MATCH (c:Community)
             OPTIONAL MATCH (e:Entity)-[r:IN_COMMUNITY]->(c)
             RETURN
                 c.id AS id,
                 count(DISTINCT e) AS size,
-                c.summary AS summary,
-                c.key_themes AS themes
+                substring(coalesce(c.summary, ""), 0, 100) AS summary,
+                substring(coalesce(c.key_themes, ""), 0, 300) AS themes
             """
 
-            communities = session.run(community_query).data()
-
-            # Get inter-community connections
+            # Get inter-community connections, counting each entity relationship once
+            # under its canonical community pair (c1.id < c2.id keeps one orientation of
+            # the undirected match). The leading count is served from the count store and
+            # stops the query before the relationship scan when no communities exist yet.
             connection_query = """
-            MATCH (c1:Community)<-[r1:IN_COMMUNITY]-(e1:Entity)
-            MATCH (e2:Entity)-[r2:IN_COMMUNITY]->(c2:Community)
-            WHERE c1 <> c2 AND (e1)-[rel]-(e2)
+            MATCH (c:Community)
+            WITH count(c) AS community_total
+            WHERE community_total > 0
+            MATCH (e1:Entity)-[rel]-(e2:Entity)
+            MATCH (e1)-[:IN_COMMUNITY]->(c1:Community), (e2)-[:IN_COMMUNITY]->(c2:Community)
+            WHERE c1.id < c2.id
             RETURN
                 c1.id AS source_community,
                 c2.id AS target_community,
-                count(rel) AS connection_count,
+                count(DISTINCT rel) AS connection_count,
                 collect(DISTINCT type(rel)) AS relationship_types
             """
 
-            connections = session.run(connection_query).data()
-
-            # Convert to Cytoscape format
-            nodes = []
-            for community in communities:
-                node = {
-                    "data": {
-                        "id": f"community_{community['id']}",
-                        "label": f"Community {community['id']}",
-                        "size": community["size"],
-                        "summary": community.get("summary", "")[:100],
-                        "themes": (
-                            community.get("themes", "").split(",")
-                            if community.get("themes")
-                            else []
-                        ),
-                    },
-                    "classes": "community",
-                    "style": {
-                        "background-color": self._get_community_color(community["id"]),
-                        "width": min(100, 50 + community["size"] * 5),
-                        "height": min(100, 50 + community["size"] * 5),
-                    },
-                }
-                nodes.append(node)
-
-            edges = []
-            for conn in connections:
-                edge = {
-                    "data": {
-                        "id": f"community_{conn['source_community']}-community_{conn['target_community']}",
-                        "source": f"community_{conn['source_community']}",
-                        "target": f"community_{conn['target_community']}",
-                        "label": f"{conn['connection_count']} connections",
-                        "connection_count": conn["connection_count"],
-                        "relationship_types": conn.get("relationship_types", []),
-                    },
-                    "classes": "community-connection",
-                }
-                edges.append(edge)
+            nodes, edges = await asyncio.gather(
+                self._run_read(
+                    community_query,
+                    functools.partial(
+                        self._community_nodes, include_inline_style=include_inline_style
+                    ),
+                ),
+                self._run_read(connection_query, self._community_edges),
+            )
 
             return {
                 "status": "success",
@@ -207,69 +259,47 @@ class VisualizationService:
             logger.error(f"Failed to get community graph: {str(e)}")
             return {"status": "error", "message": str(e)}
 
-    def get_hierarchical_graph(self) -> Dict[str, Any]:
+    @_cached_viz(ttl=60)
+    async def get_hierarchical_graph(self, limit: int = 500) -> Dict[str, Any]:
         """
         Get hierarchical graph (documents -> textunits -> entities -> communities)
 
+        Args:
+            limit: Maximum number of document/text unit/entity/community paths to include
+
         Returns:
             Dictionary with hierarchical graph data
         """
         try:
-            session = self.get_session()
-
-            # Get documents
-            doc_query = """
+            # Walk every level in one pass: TextUnits are PART_OF a Document, Entities
+            # are MENTIONED_IN TextUnits and sit IN_COMMUNITY Communities. Paths are
+            # capped before aggregation so the payload stays bounded on large graphs.
+            hierarchy_query = """
             MATCH (d:Document)
-            RETURN d.id AS id, d.filename AS label, count(d) AS count
-            """
-
-            documents = session.run(doc_query).data()
-
-            # Get relationships at different levels
-            doc_to_textunit = """
-            MATCH (d:Document)-[r:CONTAINS]->(tu:TextUnit)
-            RETURN d.id AS source, tu.id AS target, type(r) AS type
-            LIMIT 50
-            """
-
-            doc_rels = session.run(doc_to_textunit).data()
-
-            textunit_to_entity = """
-            MATCH (tu:TextUnit)-[r:CONTAINS_ENTITY]->(e:Entity)
-            RETURN tu.id AS source, e.id AS target, type(r) AS type
-            LIMIT 50
+            OPTIONAL MATCH (tu:TextUnit)-[:PART_OF]->(d)
+            OPTIONAL MATCH (e:Entity)-[:MENTIONED_IN]->(tu)
+            OPTIONAL MATCH (e)-[:IN_COMMUNITY]->(c:Community)
+            WITH d, tu, e, c
+            LIMIT $limit
+            RETURN
+                d.id AS id,
+                coalesce(d.name, d.filename) AS label,
+                collect(DISTINCT tu.id) AS textunits,
+                collect(DISTINCT CASE WHEN e IS NOT NULL THEN {
+                    textunit: tu.id,
+                    id: e.id,
+                    label: e.name,
+                    type: e.type
+                } END) AS mentions,
+                collect(DISTINCT CASE WHEN c IS NOT NULL THEN {
+                    entity: e.id,
+                    community: c.id
+                } END) AS memberships
             """
 
-            tu_rels = session.run(textunit_to_entity).data()
-
-            # Build nodes
-            nodes = []
-
-            # Document nodes
-            for doc in documents:
-                nodes.append(
-                    {
-                        "data": {
-                            "id": f"doc_{doc['id']}",
-                            "label": doc["label"] or f"Doc {doc['id']}",
-                            "type": "document",
-                        },
-                        "classes": "document",
-                    }
-                )
-
-            # Build edges
-            edges = []
-            for rel in doc_rels + tu_rels:
-                edges.append(
-                    {
-                        "data": {
-                            "source": rel["source"],
-                            "target": rel["target"],
-                            "label": rel["type"],
-                        }
-                    }
-                )
+            nodes, edges = await self._run_read(
+                hierarchy_query, self._hierarchy_elements, {"limit": limit}
+            )
 
             return {
                 "status": "success",
@@ -282,55 +312,59 @@ class VisualizationService:
             logger.error(f"Failed to get hierarchical graph: {str(e)}")
             return {"status": "error", "message": str(e)}
 
-    def get_ego_graph(self, entity_id: str, hop_limit: int = 2) -> Dict[str, Any]:
+    async def get_ego_graph(self, entity_id: str, hop_limit: int = 2) -> Dict[str, Any]:
         """
         Get ego graph centered on a specific entity
 
         Args:
             entity_id: Entity ID
-            hop_limit: Number of hops to include
+            hop_limit: Number of hops to include (clamped to 1-3)
 
         Returns:
             Dictionary with ego graph data
         """
         try:
-            session = self.get_session()
-
-            # Get central entity
-            entity_query = """
-            MATCH (e:Entity {id: $entity_id})
-            RETURN e.id AS id, e.name AS label, e.type AS type
-            """
-
-            central = session.run(entity_query, {"entity_id": entity_id}).single()
-
-            if not central:
-                return {"status": "not_found", "entity_id": entity_id}
-
-            # Get neighbors
-            neighbor_query = f"""
+            # Variable-length bounds must be literals; clamping keeps Neo4j's plan cache
+            # down to three compiled ego-graph queries
+            hop_limit = min(max(int(hop_limit), 1), 3)
+
+            # Get central entity and its neighbors in one round-trip. Paths are folded per
+            # neighbor (shortest distance, distinct relationship types) so each neighbor
+            # and its edge appear once, as Cytoscape requires unique element ids.
+            ego_query = f"""
             MATCH (e:Entity {{id: $entity_id}})
-            MATCH (e)-[r*1..{hop_limit}]-(neighbor:Entity)
+            OPTIONAL MATCH path = (e)-[*1..{hop_limit}]-(neighbor:Entity)
+            WHERE neighbor <> e
+            WITH e, neighbor,
+                 min(length(path)) AS distance,
+                 collect([rel IN relationships(path) | type(rel)]) AS path_types
+            WITH e, neighbor, distance,
+                 reduce(
+                     types = [],
+                     t IN reduce(flat = [], ts IN path_types | flat + ts) |
+                     CASE WHEN t IN types THEN types ELSE types + t END
+                 ) AS types
             RETURN
-                neighbor.id AS id,
-                neighbor.name AS label,
-                neighbor.type AS type,
-                length(path) AS distance
+                e.id AS id,
+                e.name AS label,
+                e.type AS type,
+                collect(CASE WHEN neighbor IS NOT NULL THEN {{
+                    id: neighbor.id,
+                    label: neighbor.name,
+                    type: neighbor.type,
+                    distance: distance,
+                    types: types
+                }} END) AS neighbors
             """
 
-            neighbors = session.run(neighbor_query, {"entity_id": entity_id}).data()
+            central = await self._run_read(
+                ego_query, lambda result: result.single(), {"entity_id": entity_id}
+            )
 
-            # Get relationships
-            rel_query = f"""
-            MATCH (e:Entity {{id: $entity_id}})
-            MATCH path = (e)-[r*1..{hop_limit}]-(neighbor:Entity)
-            RETURN
-                e.id AS source,
-                neighbor.id AS target,
-                [rel in relationships(path) | type(rel)] AS types
-            """
+            if not central:
+                return {"status": "not_found", "entity_id": entity_id}
 
-            relationships = session.run(rel_query, {"entity_id": entity_id}).data()
+            neighbors = central["neighbors"]
 
             # Build nodes
             nodes = []
@@ -358,16 +392,17 @@ class VisualizationService:
                     }
                 )
 
-            # Build edges
+            # Build edges: one per neighbor, labelled with every relationship type on
+            # the paths reaching it
             edges = []
-            for rel in relationships:
+            for neighbor in neighbors:
                 edges.append(
                     {
                         "data": {
-                            "id": f"{rel['source']}-{rel['target']}",
-                            "source": rel["source"],
-                            "target": rel["target"],
-                            "label": ",".join(rel.get("types", [])),
+                            "id": f"{central['id']}-{neighbor['id']}",
+                            "source": central["id"],
+                            "target": neighbor["id"],
+                            "label": ",".join(neighbor["types"]),
                         }
                     }
                 )
@@ -384,38 +419,151 @@ class VisualizationService:
             logger.error(f"Failed to get ego graph: {str(e)}")
             return {"status": "error", "message": str(e)}
 
+    async def _entity_graph_elements(
+        self, records, include_inline_style: bool = False
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """Convert entity graph records to Cytoscape nodes and edges as they stream in"""
+        nodes = []
+        edges = []
+        sources_seen = set()
+        async for entity in records:
+            # Nodes arrive already in Cytoscape shape; styling is keyed off `classes`
+            entity_id = entity["id"]
+            node = entity["node"]
+            if include_inline_style:
+                node["style"] = self._get_node_style(node["data"]["type"])
+            nodes.append(node)
+
+            # An entity in several communities appears once per community
+            if entity_id in sources_seen:
+                continue
+            sources_seen.add(entity_id)
+
+            for rel in entity["relationships"]:
+                edges.append(
+                    {
+                        "data": {
+                            "id": f"{entity_id}-{rel['target']}",
+                            "source": entity_id,
+                            "target": rel["target"],
+                            "label": rel["type"],
+                            "description": rel.get("description", ""),
+                            "confidence": rel.get("confidence", 0.5),
+                        },
+                        "classes": f"relationship {rel['type'].lower()}",
+                    }
+                )
+
+        return nodes, edges
+
+    async def _community_nodes(self, records, include_inline_style: bool = False) -> List[Dict]:
+        """Convert community records to Cytoscape nodes"""
+        nodes = []
+        async for community in records:
+            community_id = community["id"]
+            size = community["size"]
+            themes = community["themes"]
+            node = {
+                "data": {
+                    "id": f"community_{community_id}",
+                    "label": f"Community {community_id}",
+                    "size": size,
+                    "summary": community["summary"],
+                    "themes": themes.split(",") if themes else [],
+                },
+                "classes": "community",
+            }
+            if include_inline_style:
+                node["style"] = {
+                    "background-color": self._get_community_color(community_id),
+                    "width": min(100, 50 + size * 5),
+                    "height": min(100, 50 + size * 5),
+                }
+            nodes.append(node)
+        return nodes
+
+    async def _community_edges(self, records) -> List[Dict]:
+        """Convert inter-community connection records to Cytoscape edges"""
+        edges = []
+        async for conn in records:
+            source = f"community_{conn['source_community']}"
+            target = f"community_{conn['target_community']}"
+            edges.append(
+                {
+                    "data": {
+                        "id": f"{source}-{target}",
+                        "source": source,
+                        "target": target,
+                        "label": f"{conn['connection_count']} connections",
+                        "connection_count": conn["connection_count"],
+                        "relationship_types": conn["relationship_types"] or [],
+                    },
+                    "classes": "community-connection",
+                }
+            )
+        return edges
+
+    async def _hierarchy_elements(self, records) -> Tuple[List[Dict], List[Dict]]:
+        """Convert per-document hierarchy records to Cytoscape nodes and edges"""
+        nodes = []
+        edges = []
+        # Entities and communities recur across documents; emit each element once
+        seen_nodes = set()
+        seen_edges = set()
+
+        def add_node(node_id: str, label: str, level: str, **data) -> None:
+            if node_id in seen_nodes:
+                return
+            seen_nodes.add(node_id)
+            nodes.append(
+                {
+                    "data": {"id": node_id, "label": label, "type": level, **data},
+                    "classes": level,
+                }
+            )
+
+        def add_edge(source: str, target: str, label: str) -> None:
+            edge_id = f"{source}-{target}"
+            if edge_id in seen_edges:
+                return
+            seen_edges.add(edge_id)
+            edges.append(
+                {
+                    "data": {
+                        "id": edge_id,
+                        "source": source,
+                        "target": target,
+                        "label": label,
+                    }
+                }
+            )
+
+        async for doc in records:
+            doc_node = f"doc_{doc['id']}"
+            add_node(doc_node, doc["label"] or f"Doc {doc['id']}", "document")
+
+            for textunit_id in doc["textunits"]:
+                add_node(textunit_id, textunit_id, "textunit")
+                add_edge(textunit_id, doc_node, "PART_OF")
+
+            for mention in doc["mentions"]:
+                add_node(mention["id"], mention["label"], "entity", entity_type=mention["type"])
+                add_edge(mention["id"], mention["textunit"], "MENTIONED_IN")
+
+            for membership in doc["memberships"]:
+                community_node = f"community_{membership['community']}"
+                add_node(community_node, f"Community {membership['community']}", "community")
+                add_edge(membership["entity"], community_node, "IN_COMMUNITY")
+
+        return nodes, edges
+
     def _get_node_style(self, entity_type: str) -> Dict[str, Any]:
         """Get visual style for node based on entity type"""
-        colors = {
-            "PERSON": "#FF6B6B",
-            "ORGANIZATION": "#4ECDC4",
-            "LOCATION": "#45B7D1",
-            "CONCEPT": "#96CEB4",
-            "EVENT": "#FFEAA7",
-            "PRODUCT": "#DDA15E",
-            "OTHER": "#C9ADA7",
-        }
-        return {
-            "background-color": colors.get(entity_type, "#999999"),
-            "width": "50px",
-            "height": "50px",
-        }
+        return _NODE_STYLES.get(entity_type, _DEFAULT_STYLE)
 
     def _get_community_color(self, community_id: int) -> str:
         """Generate color for community based on ID"""
-        colors = [
-            "#FF6B6B",
-            "#4ECDC4",
-            "#45B7D1",
-            "#96CEB4",
-            "#FFEAA7",
-            "#DDA15E",
-            "#BC6C25",
-            "#9D4EDD",
-            "#5A189A",
-            "#3C096C",
-        ]
-        return colors[community_id % len(colors)]
+        return _COMMUNITY_COLORS[community_id % len(_COMMUNITY_COLORS)]
 
 
 # Singleton instance
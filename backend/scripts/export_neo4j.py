@@ -1,10 +1,10 @@
 import argparse
-import json
 import os
 import sys
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List
 
+import orjson
 from neo4j import GraphDatabase
 
 
@@ -16,44 +16,89 @@ def serialize_default(obj: Any) -> Any:
         return None
 
 
-def fetch_nodes(session) -> List[Dict[str, Any]]:
+DEFAULT_BATCH_SIZE = 50000
+
+
+def _iter_batches(
+    session, query: str, batch_size: int, **params: Any
+) -> Iterator[Dict[str, Any]]:
+    """Page through an id-ordered query, resuming after the last id seen.
+
+    Keyset paging keeps every page a bounded server-side sort, where SKIP would
+    re-walk all earlier rows on each page.
+    """
+    after = -1
+    while True:
+        rows = session.run(query, after=after, batch=batch_size, **params).data()
+        if not rows:
+            return
+        yield from rows
+        if len(rows) < batch_size:
+            return
+        after = rows[-1]["id"]
+
+
+def iter_nodes(session, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
     query = """
     MATCH (n)
+    WHERE id(n) > $after
     RETURN id(n) AS id, labels(n) AS labels, properties(n) AS properties
     ORDER BY id(n)
+    LIMIT $batch
     """
-    result = session.run(query)
-    nodes = []
-    for record in result:
-        nodes.append(
-            {
-                "id": record["id"],
-                "labels": record["labels"],
-                "properties": record["properties"],
+    return _iter_batches(session, query, batch_size)
+
+
+def _quote(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
+
+def fetch_rel_type_properties(session) -> Dict[str, List[str]]:
+    """Map each relationship type to the property keys the schema reports for it."""
+    properties: Dict[str, List[str]] = {}
+    for record in session.run("CALL db.schema.relTypeProperties()"):
+        # relType comes back as :`TYPE`
+        rel_type = record["relType"][2:-1].replace("``", "`")
+        keys = properties.setdefault(rel_type, [])
+        if record["propertyName"] is not None:
+            keys.append(record["propertyName"])
+    return properties
+
+
+def iter_relationships(
+    session, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[Dict[str, Any]]:
+    # Project each type's known keys instead of properties(r), so the server
+    # sends flat value lists rather than one map per relationship. The schema
+    # procedure may sample, so a relationship carrying a key it did not report
+    # falls back to its full property map and nothing is dropped.
+    for rel_type, keys in fetch_rel_type_properties(session).items():
+        projection = ", ".join(f"r.{_quote(key)}" for key in keys)
+        query = f"""
+        MATCH (a)-[r:{_quote(rel_type)}]->(b)
+        WHERE id(r) > $after
+        RETURN id(r) AS id, id(a) AS start, id(b) AS end, [{projection}] AS values,
+            CASE WHEN all(k IN keys(r) WHERE k IN $keys) THEN null
+                ELSE properties(r) END AS extra
+        ORDER BY id(r)
+        LIMIT $batch
+        """
+        for row in _iter_batches(session, query, batch_size, keys=keys):
+            if row["extra"] is not None:
+                properties = row["extra"]
+            else:
+                properties = {
+                    key: value
+                    for key, value in zip(keys, row["values"], strict=True)
+                    if value is not None
+                }
+            yield {
+                "id": row["id"],
+                "type": rel_type,
+                "start": row["start"],
+                "end": row["end"],
+                "properties": properties,
             }
-        )
-    return nodes
-
-
-def fetch_relationships(session) -> List[Dict[str, Any]]:
-    query = """
-    MATCH (a)-[r]->(b)
-    RETURN id(r) AS id, type(r) AS type, id(a) AS start, id(b) AS end, properties(r) AS properties
-    ORDER BY id(r)
-    """
-    result = session.run(query)
-    relationships = []
-    for record in result:
-        relationships.append(
-            {
-                "id": record["id"],
-                "type": record["type"],
-                "start": record["start"],
-                "end": record["end"],
-                "properties": record["properties"],
-            }
-        )
-    return relationships
 
 
 def fetch_schema_stats(session) -> Dict[str, Any]:
@@ -79,30 +124,51 @@ def fetch_schema_stats(session) -> Dict[str, Any]:
     }
 
 
-def export_neo4j(uri: str, user: str, password: str, out_path: str) -> str:
+def write_json_array(f: BinaryIO, items: Iterable[Dict[str, Any]]) -> int:
+    """Write items as a JSON array one element per line; returns the item count."""
+    count = 0
+    f.write(b"[")
+    for item in items:
+        f.write(b",\n" if count else b"\n")
+        f.write(orjson.dumps(item, default=serialize_default))
+        count += 1
+    f.write(b"\n]" if count else b"]")
+    return count
+
+
+def export_neo4j(
+    uri: str,
+    user: str,
+    password: str,
+    out_path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> str:
     driver = GraphDatabase.driver(uri, auth=(user, password))
     try:
-        with driver.session() as session:
-            nodes = fetch_nodes(session)
-            relationships = fetch_relationships(session)
-            stats = fetch_schema_stats(session)
-
-        export = {
-            "meta": {
-                "exportedAt": datetime.utcnow().isoformat() + "Z",
-                "uri": uri,
-                "user": user,
-                "tool": "export_neo4j.py",
-                "version": 1,
-            },
-            "stats": stats,
-            "nodes": nodes,
-            "relationships": relationships,
+        meta = {
+            "exportedAt": datetime.utcnow().isoformat() + "Z",
+            "uri": uri,
+            "user": user,
+            "tool": "export_neo4j.py",
+            "version": 1,
         }
 
         os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(export, f, ensure_ascii=False, indent=2, default=serialize_default)
+
+        # Stream nodes and relationships to disk one page at a time so memory
+        # stays bounded on both the server and the client regardless of graph size
+        with driver.session() as session, open(out_path, "wb") as f:
+            stats = fetch_schema_stats(session)
+
+            f.write(b'{"meta":')
+            f.write(orjson.dumps(meta))
+            f.write(b',\n"stats":')
+            f.write(orjson.dumps(stats, default=serialize_default))
+            f.write(b',\n"nodes":')
+            write_json_array(f, iter_nodes(session, batch_size))
+            f.write(b',\n"relationships":')
+            write_json_array(f, iter_relationships(session, batch_size))
+            f.write(b"}\n")
 
         return out_path
     finally:
@@ -131,6 +197,12 @@ def parse_args() -> argparse.Namespace:
         default=os.path.join(os.path.dirname(__file__), "..", "..", "neo4j_dump.json"),
         help="Output JSON file path (default: project_root/neo4j_dump.json)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Nodes/relationships fetched per query (default: {DEFAULT_BATCH_SIZE})",
+    )
     return parser.parse_args()
 
 
@@ -138,7 +210,9 @@ def main() -> None:
     args = parse_args()
     try:
         out_path = os.path.abspath(args.out)
-        exported = export_neo4j(args.uri, args.user, args.password, out_path)
+        exported = export_neo4j(
+            args.uri, args.user, args.password, out_path, args.batch_size
+        )
         print(f"Exported Neo4j graph to: {exported}")
     except Exception as e:
         print(f"Failed to export Neo4j graph: {e}", file=sys.stderr)
@@ -0,0 +1,50 @@
+"""
+Tests for the authentication API, driven through the in-process async client
+"""
+
+from tests.conftest import TEST_USER_PASSWORD
+
+
+async def test_me_requires_bearer_token(async_client):
+    """Without credentials HTTPBearer rejects the request before any lookup"""
+    response = await async_client.get("/api/auth/me")
+
+    assert response.status_code in (401, 403)
+
+
+async def test_me_rejects_invalid_token(async_client):
+    """A token that fails verification is a 401, not a server error"""
+    response = await async_client.get(
+        "/api/auth/me", headers={"Authorization": "Bearer not-a-token"}
+    )
+
+    assert response.status_code == 401
+
+
+async def test_token_login_issues_access_token(async_client, test_user):
+    """Valid credentials return a bearer token and the user's profile"""
+    response = await async_client.post(
+        "/api/auth/token", json={"email": test_user.email, "password": TEST_USER_PASSWORD}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["token_type"] == "bearer"
+    assert body["user"]["email"] == test_user.email
+
+
+async def test_token_login_rejects_wrong_password(async_client, test_user):
+    """A wrong password gets the same 401 as an unknown email"""
+    response = await async_client.post(
+        "/api/auth/token", json={"email": test_user.email, "password": "wrong-password"}
+    )
+
+    assert response.status_code == 401
+
+
+async def test_me_returns_token_owner(authenticated_async_client, test_user):
+    """The bearer token resolves to the user it was issued for"""
+    response = await authenticated_async_client.get("/api/auth/me")
+
+    assert response.status_code == 200
+    assert response.json()["email"] == test_user.email
@@ -0,0 +1,48 @@
+"""
+Tests for the shared database fixtures in conftest.py
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models.document import Document
+
+
+def test_documents_factory_inserts_documents_for_test_user(db, test_user, documents_factory):
+    """Factory rows are committed through the test's session and owned by the test user"""
+    documents = documents_factory(3, status="completed")
+
+    stored = db.query(Document).filter(Document.user_id == test_user.id).all()
+    assert {d.id for d in stored} == {d.id for d in documents}
+    assert all(d.status == "completed" for d in stored)
+
+
+def test_documents_factory_rows_are_rolled_back(db, test_user, documents_factory):
+    """The factory's commit only releases a savepoint, so an enclosing rollback discards it"""
+
+    def count() -> int:
+        return db.query(Document).filter(Document.user_id == test_user.id).count()
+
+    baseline = count()
+    # Close the session so its next savepoint opens inside this one, as it does inside
+    # the db fixture's outer transaction
+    db.close()
+    savepoint = db.get_bind().begin_nested()
+
+    documents_factory(2)
+    assert count() == baseline + 2
+
+    db.close()
+    savepoint.rollback()
+    assert count() == baseline
+
+
+@pytest.mark.pg
+def test_documents_require_an_existing_user(db):
+    """PostgreSQL enforces the users foreign key; SQLite would accept the orphan row"""
+    db.add(Document(user_id=uuid.uuid4(), filename="orphan.md", file_path="uploads/orphan.md"))
+
+    with pytest.raises(IntegrityError):
+        db.flush()
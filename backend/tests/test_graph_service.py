@@ -0,0 +1,110 @@
+"""
+Integration tests for graph_service bulk writes against a live Neo4j
+"""
+
+import pytest
+
+from app.services.graph_service import graph_service
+
+pytestmark = pytest.mark.integration
+
+
+def test_bulk_create_entities_returns_ids_in_input_order(neo4j_session, neo4j_prefix):
+    """One UNWIND creates every row and reports IDs in the order they were given"""
+    entities = [
+        {"name": f"{neo4j_prefix}alice", "type": "PERSON", "description": "a"},
+        {"name": f"{neo4j_prefix}acme", "type": "ORGANIZATION", "description": "b"},
+    ]
+
+    ids = graph_service.bulk_create_entities(entities, session=neo4j_session)
+
+    stored = neo4j_session.run(
+        "UNWIND $ids AS id MATCH (e:Entity {id: id}) RETURN e.name AS name", ids=ids
+    )
+    assert [record["name"] for record in stored] == [e["name"] for e in entities]
+
+
+def test_bulk_create_entities_merges_on_name_and_type(neo4j_session, neo4j_prefix):
+    """Repeated rows reuse the node, bump mention_count and keep the highest confidence"""
+    entity = {"name": f"{neo4j_prefix}alice", "type": "PERSON", "confidence": 0.5}
+
+    first = graph_service.bulk_create_entities([entity], session=neo4j_session)
+    second = graph_service.bulk_create_entities(
+        [entity, {**entity, "confidence": 0.9}], session=neo4j_session
+    )
+
+    assert second == first * 2
+    record = neo4j_session.run(
+        "MATCH (e:Entity {id: $id}) RETURN e.mention_count AS mentions, e.confidence AS confidence",
+        id=first[0],
+    ).single()
+    assert record["mentions"] == 3
+    assert record["confidence"] == 0.9
+
+
+def test_bulk_delete_entities_detaches_and_counts(neo4j_session, neo4j_prefix):
+    """Entities go with their relationships; unknown ids are ignored"""
+    ids = graph_service.bulk_create_entities(
+        [
+            {"name": f"{neo4j_prefix}alice", "type": "PERSON"},
+            {"name": f"{neo4j_prefix}acme", "type": "ORGANIZATION"},
+        ],
+        session=neo4j_session,
+    )
+    neo4j_session.run(
+        "MATCH (a:Entity {id: $a}), (b:Entity {id: $b}) CREATE (a)-[:RELATED_TO]->(b)",
+        a=ids[0],
+        b=ids[1],
+    ).consume()
+
+    deleted = graph_service.bulk_delete_entities(
+        ids + [f"{neo4j_prefix}missing"], session=neo4j_session
+    )
+
+    assert deleted == 2
+    remaining = neo4j_session.run(
+        "UNWIND $ids AS id MATCH (e:Entity {id: id}) RETURN count(e) AS n", ids=ids
+    ).single()
+    assert remaining["n"] == 0
+
+
+def test_delete_document_graph_data_removes_only_orphaned_entities(neo4j_session, neo4j_prefix):
+    """Entities mentioned by another document survive with their mention_count decremented"""
+    doc_id, other_doc_id = f"{neo4j_prefix}doc", f"{neo4j_prefix}other"
+    orphan_id, shared_id = graph_service.bulk_create_entities(
+        [
+            {"name": f"{neo4j_prefix}orphan", "type": "PERSON"},
+            {"name": f"{neo4j_prefix}shared", "type": "PERSON"},
+        ],
+        session=neo4j_session,
+    )
+    neo4j_session.run(
+        """
+        UNWIND [$doc_id, $other_doc_id] AS document_id
+        CREATE (d:Document {id: document_id})
+        CREATE (t:TextUnit {id: document_id + '-t', document_id: document_id})-[:PART_OF]->(d)
+        WITH t, document_id
+        MATCH (shared:Entity {id: $shared_id})
+        CREATE (shared)-[:MENTIONED_IN]->(t)
+        SET shared.mention_count = shared.mention_count + 1
+        WITH t, document_id
+        WHERE document_id = $doc_id
+        MATCH (orphan:Entity {id: $orphan_id})
+        CREATE (orphan)-[:MENTIONED_IN]->(t)
+        """,
+        doc_id=doc_id,
+        other_doc_id=other_doc_id,
+        orphan_id=orphan_id,
+        shared_id=shared_id,
+    ).consume()
+
+    result = graph_service.delete_document_graph_data(doc_id, session=neo4j_session)
+
+    assert result["status"] == "success"
+    assert result["entities_deleted"] == 1
+    assert result["textunits_deleted"] == 1
+    stored = neo4j_session.run(
+        "UNWIND $ids AS id MATCH (e:Entity {id: id}) RETURN e.id AS id, e.mention_count AS n",
+        ids=[orphan_id, shared_id],
+    ).data()
+    assert stored == [{"id": shared_id, "n": 2}]
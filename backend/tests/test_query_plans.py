@@ -0,0 +1,37 @@
+"""
+Plan guards: hot graph lookups must resolve through the schema's indexes
+"""
+
+import pytest
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.parametrize(
+    "query, params",
+    [
+        ("MATCH (e:Entity {id: $id}) RETURN e", {"id": "x"}),
+        ("UNWIND $ids AS id MATCH (e:Entity {id: id}) RETURN e", {"ids": ["x", "y"]}),
+        ("MATCH (e:Entity {name: $name}) RETURN e", {"name": "x"}),
+        ("MATCH (c:Community {level: $level}) RETURN c", {"level": 0}),
+        ("MATCH (t:TextUnit {document_id: $document_id}) RETURN t", {"document_id": "x"}),
+        ("MATCH (d:Document {id: $id}) RETURN d", {"id": "x"}),
+    ],
+    ids=[
+        "entity-by-id",
+        "entities-by-ids",
+        "entity-by-name",
+        "community-by-level",
+        "textunits-by-document",
+        "document-by-id",
+    ],
+)
+def test_lookup_uses_index(neo4j_assert_no_label_scan, query, params):
+    """The planner seeks an index rather than scanning every node of the label"""
+    neo4j_assert_no_label_scan(query, **params)
+
+
+def test_guard_flags_label_scan(neo4j_assert_no_label_scan):
+    """An unindexed predicate must trip the guard, or the cases above prove nothing"""
+    with pytest.raises(pytest.fail.Exception, match="NodeByLabelScan"):
+        neo4j_assert_no_label_scan("MATCH (e:Entity {unindexed: $value}) RETURN e", value="x")
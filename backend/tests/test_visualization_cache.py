@@ -0,0 +1,96 @@
+"""
+Tests for the graph-version keyed visualization cache
+"""
+
+import pytest
+
+from app.services import visualization_service
+from app.services.visualization_service import _cached_viz
+
+
+class FakeCacheService:
+    """In-memory stand-in for the cache_service calls made by _cached_viz"""
+
+    def __init__(self, version=0):
+        self.version = version
+        self.store = {}
+
+    def get_graph_version(self):
+        return self.version
+
+    def get_cached_visualization(self, key):
+        return self.store.get(key)
+
+    def cache_visualization(self, key, payload, ttl=60):
+        self.store[key] = payload
+        return True
+
+
+class CountingService:
+    """Counts how often the wrapped query actually runs"""
+
+    def __init__(self):
+        self.calls = 0
+
+    @_cached_viz(ttl=60)
+    async def get_graph(self, limit: int = 100, status: str = "success"):
+        self.calls += 1
+        return {"status": status, "limit": limit}
+
+
+@pytest.fixture
+def fake_cache(monkeypatch) -> FakeCacheService:
+    cache = FakeCacheService()
+    monkeypatch.setattr(visualization_service, "cache_service", cache)
+    return cache
+
+
+async def test_second_call_is_served_from_cache(fake_cache):
+    service = CountingService()
+
+    first = await service.get_graph(limit=10)
+    second = await service.get_graph(10)
+
+    assert first == second == {"status": "success", "limit": 10}
+    assert service.calls == 1
+    assert len(fake_cache.store) == 1
+
+
+async def test_different_arguments_miss(fake_cache):
+    service = CountingService()
+
+    await service.get_graph(limit=10)
+    await service.get_graph(limit=20)
+
+    assert service.calls == 2
+
+
+async def test_graph_version_bump_invalidates(fake_cache):
+    service = CountingService()
+
+    await service.get_graph()
+    fake_cache.version += 1
+    await service.get_graph()
+
+    assert service.calls == 2
+
+
+async def test_errors_are_not_cached(fake_cache):
+    service = CountingService()
+
+    await service.get_graph(status="error")
+    await service.get_graph(status="error")
+
+    assert service.calls == 2
+    assert fake_cache.store == {}
+
+
+async def test_redis_unavailable_bypasses_cache(fake_cache):
+    fake_cache.version = None
+    service = CountingService()
+
+    await service.get_graph()
+    await service.get_graph()
+
+    assert service.calls == 2
+    assert fake_cache.store == {}